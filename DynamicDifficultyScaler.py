@@ -1,6 +1,232 @@
 import os
 import json
-from typing import Optional, Dict, Any
+import math
+import operator
+from collections import deque
+from typing import Optional, Dict, Any, Callable, NamedTuple
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernels below run as plain Python.
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+
+    def _dumps(obj: Dict[str, float]) -> bytes:
+        # orjson writes inf/NaN as null, so hand those states to the stdlib
+        # encoder, which keeps its Infinity/NaN tokens and round-trips them.
+        if all(map(math.isfinite, obj.values())):
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def _loads(data: bytes) -> Dict[str, Any]:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Infinity/NaN tokens written by the stdlib encoder
+            return json.loads(data)
+except ImportError:
+    def _dumps(obj: Dict[str, float]) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _loads = json.loads
+
+
+# -----------------------------
+# Scalar kernels
+# -----------------------------
+@njit(cache=True, fastmath=True)
+def _time_reward(vtr: float, eff_total: float, normal: float, low: float,
+                 high_thr: float, high_cap: float,
+                 cap_range: float, inv_span: float) -> float:
+    # Pure numeric core of DynamicDifficultyScaler.calculate_time_reward.
+    eff_total = max(1e-9, eff_total)
+    t = max(0.0, min(vtr / eff_total, 1.0))
+
+    base = normal
+    max_late = low
+
+    # Force max reward if very little time remains
+    if vtr < 20.0:
+        return max_late
+
+    # Dynamic cap from absolute minutes remaining: frac is 0 at/above high_thr
+    # (cap = high_cap) and 1 at/below low_thr (cap = max_late).
+    frac = max(0.0, min(1.0, (high_thr - vtr) * inv_span))
+    cap = high_cap + cap_range * frac
+    # Baseline nonlinear curve
+    one_minus_t = 1.0 - t
+    reward = base + (max_late - base) * one_minus_t * one_minus_t
+    # Clamp to cap (keep min at base)
+    return max(base, min(reward, cap))
+
+
+@njit(cache=True)
+def _update_mv(mv: float, earned: float, vtr: float, eff_total: float,
+               target_win_time: float, target_points: float,
+               adjustment_rate: float, mn: float, mx: float) -> float:
+    # Pure numeric core of DynamicDifficultyScaler.update_milestone_value.
+    # Returns the clamped (unrounded) milestone value.
+    visible_elapsed = max(0.0, eff_total - vtr)
+
+    # If effectively no progress in visible time, don't change value
+    # if visible_elapsed < 1e-6:
+    #     return mv
+
+    # Expected points by now to finish around target_win_time
+    elapsed_for_target = min(visible_elapsed, target_win_time)
+    expected_points = (elapsed_for_target / target_win_time) * target_points
+    pace_ratio = (earned / expected_points) if expected_points > 0 else 1.0
+
+    # Absolute time factor: t near 1 early-game, 0 late-game
+    t = max(0.0, min(vtr / eff_total, 1.0))
+    t2 = t * t
+    # Make reductions stronger early: factor in [1, 2]
+    reduction_strength = adjustment_rate * (1.0 + t2)
+    # Make increases milder early, stronger late
+    increase_strength = adjustment_rate / (1.0 + t2)
+
+    if pace_ratio > 1.0:
+        # Exponential reduction when ahead of pace (more aggressive early)
+        mv *= (1.0 / pace_ratio) ** reduction_strength
+    elif pace_ratio < 1.0:
+        # Linear(ish) boost when behind pace (gentler early)
+        mv *= 1.0 + increase_strength * (1.0 - pace_ratio)
+
+    # Clamp
+    return max(mn, min(mv, mx))
+
+
+# Bump whenever a kernel's signature or semantics change; build_kernels.py
+# bakes it into dds_kernels so a stale build is ignored instead of failing.
+_KERNEL_VERSION = 1
+
+_time_reward_kernel = _time_reward
+_update_mv_kernel = _update_mv
+try:
+    # Ahead-of-time compiled kernels (see build_kernels.py): no JIT warmup.
+    import dds_kernels
+except ImportError:
+    pass
+else:
+    if getattr(dds_kernels, "kernel_version", lambda: None)() == _KERNEL_VERSION:
+        _time_reward_kernel = dds_kernels.time_reward
+        _update_mv_kernel = dds_kernels.update_mv
+    else:
+        print("[INFO] dds_kernels is out of date; rerun build_kernels.py. Using JIT kernels.")
+
+
+# -----------------------------
+# Vectorized kernels (numpy)
+# -----------------------------
+def _time_rewards_np(vtr, eff_total, normal, low, high_thr, high_cap,
+                     cap_range, inv_span):
+    # Elementwise _time_reward; arguments are arrays or scalars that broadcast.
+    eff_total = np.maximum(eff_total, 1e-9)
+    t = np.clip(vtr / eff_total, 0.0, 1.0)
+    one_minus_t = 1.0 - t
+    reward = normal + (low - normal) * one_minus_t * one_minus_t
+    cap = high_cap + cap_range * np.clip((high_thr - vtr) * inv_span, 0.0, 1.0)
+    reward = np.maximum(normal, np.minimum(reward, cap))
+    # Force max reward if very little time remains
+    return np.where(vtr < 20.0, low, reward)
+
+
+def _update_mvs_np(mv, earned, vtr, eff_total, target_win_time, target_points,
+                   adjustment_rate, mn, mx):
+    # Elementwise _update_mv; returns the clamped (unrounded) milestone values.
+    visible_elapsed = np.maximum(0.0, eff_total - vtr)
+    elapsed_for_target = np.minimum(visible_elapsed, target_win_time)
+    expected_points = (elapsed_for_target / target_win_time) * target_points
+    # Both branches of each where are evaluated; silence the unused ones
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        pace_ratio = np.where(expected_points > 0, earned / expected_points, 1.0)
+        t = np.clip(vtr / eff_total, 0.0, 1.0)
+        t2 = t * t
+        reduction_strength = adjustment_rate * (1.0 + t2)
+        increase_strength = adjustment_rate / (1.0 + t2)
+        mv = np.where(pace_ratio > 1.0, mv * (1.0 / pace_ratio) ** reduction_strength,
+                      np.where(pace_ratio < 1.0,
+                               mv * (1.0 + increase_strength * (1.0 - pace_ratio)),
+                               mv))
+    return np.maximum(mn, np.minimum(mv, mx))
+
+
+# (attribute, caster) for every field written by save_state and restored by
+# load_state, in file order. No default column: _reset() sets every field, so
+# a key missing from an older save just keeps the instance's current value.
+_PERSIST_SPEC = (
+    ("target_points", float),
+    ("initial_milestone_value", float),
+    ("milestone_value", float),
+    ("earned_points", float),
+    ("visible_total_time", float),
+    ("visible_time_remaining", float),
+    ("target_win_time", float),
+    ("normal_time_reward", float),
+    ("low_time_reward", float),
+    ("high_time_threshold", float),
+    ("low_time_threshold", float),
+    ("high_time_cap", float),
+    ("start_visible_total_time", float),
+    ("awarded_time_ledger", float),
+    ("adjustment_rate", float),
+    ("min_milestone_value", float),
+    ("max_milestone_value", float),
+)
+_PERSIST_FIELDS = tuple(name for name, _ in _PERSIST_SPEC)
+
+# Inputs of the derived time-reward constants; each is stored in a "_<name>"
+# slot behind a property that refreshes the constants on assignment.
+_REWARD_CURVE_FIELDS = ("low_time_reward", "high_time_threshold",
+                        "low_time_threshold", "high_time_cap")
+
+
+def _cached_input(name: str, refresh: Callable[[Any], None]) -> property:
+    # Public attribute backed by slot "_<name>"; reads go through a C-level
+    # attrgetter and assigning it calls refresh(self) so derived caches
+    # never go stale.
+    slot = "_" + name
+
+    def fset(self, value):
+        setattr(self, slot, value)
+        refresh(self)
+
+    return property(operator.attrgetter(slot), fset)
+
+
+# Display labels for GameState fields, in field order (see GameState.as_dict)
+_GAME_STATE_LABELS = ("Pts Won", "Pts Rem", "Reward", "Flag Val", "Clock",
+                      "TT", "ET", "Time Elapsed", "TWT", "PR")
+
+
+class GameState(NamedTuple):
+    """Snapshot returned by DynamicDifficultyScaler.get_game_state."""
+    pts_won: float        # Points won so far
+    pts_rem: float        # Points remaining
+    reward: float         # Current time reward
+    flag_val: int
+    clock: float
+    tt: float             # Visible total time
+    et: float             # Effective total time
+    time_elapsed: float   # Visible time elapsed
+    twt: float            # Target win time
+    pr: float             # Pace ratio
+
+    def as_dict(self) -> Dict[str, Any]:
+        # Dict keyed by the display labels get_game_state used to return.
+        return dict(zip(_GAME_STATE_LABELS, self))
+
 
 class DynamicDifficultyScaler:
     """
@@ -14,6 +240,14 @@ class DynamicDifficultyScaler:
       - Be robust to time being added/removed so visible_elapsed never goes negative.
     """
 
+    __slots__ = (tuple(f for f in _PERSIST_FIELDS if f not in _REWARD_CURVE_FIELDS)
+                 + tuple("_" + f for f in _REWARD_CURVE_FIELDS)
+                 + ("visible_elapsed", "_inv_span", "_cap_range",
+                    "_pooled"))
+
+    # Free-list of released instances reused by acquire(); one per class
+    _POOL: "deque[DynamicDifficultyScaler]" = deque()
+
     # -----------------------------
     # Construction
     # -----------------------------
@@ -25,7 +259,18 @@ class DynamicDifficultyScaler:
                  adjustment_rate: float = 0.25,       # tune 0.15–0.5
                  min_milestone_value: float = 1.0,
                  max_milestone_value: float = 20.0):
+        self._reset(target_points, initial_milestone_value, visible_total_time,
+                    target_win_time, adjustment_rate, min_milestone_value,
+                    max_milestone_value)
 
+    def _reset(self,
+               target_points: int = 100,
+               initial_milestone_value: float = 10,
+               visible_total_time: float = 100.0,
+               target_win_time: float = 400.0,
+               adjustment_rate: float = 0.25,
+               min_milestone_value: float = 1.0,
+               max_milestone_value: float = 20.0) -> None:
         # Core config
         self.target_points = float(target_points)
         self.initial_milestone_value = float(initial_milestone_value)
@@ -44,15 +289,61 @@ class DynamicDifficultyScaler:
         # Base/min reward early game
         self.normal_time_reward = 1.0
         # Max reward late game (<= low_time_threshold)
-        self.low_time_reward = 20.0
+        self._low_time_reward = 20.0
         # Thresholds for absolute minute-based capping
-        self.high_time_threshold = 50.0   # ≥ this -> cap at high_time_cap
-        self.low_time_threshold  = 30.0   # ≤ this -> cap at low_time_reward
-        self.high_time_cap = 5.0          # max reward when plenty of time remains
+        self._high_time_threshold = 50.0   # ≥ this -> cap at high_time_cap
+        self._low_time_threshold  = 30.0   # ≤ this -> cap at low_time_reward
+        self._high_time_cap = 5.0          # max reward when plenty of time remains
 
         # Robust elapsed-time accounting
         self.start_visible_total_time = float(visible_total_time)
         self.awarded_time_ledger = 0.0    # track minutes we (DDS) told engine to add
+        self.visible_elapsed = 0.0
+        self._pooled = False
+
+        self._recompute_cached()
+
+    def _recompute_cached(self) -> None:
+        # Derived time-reward constants; refresh whenever thresholds/rewards change.
+        self._inv_span = 1.0 / max(1e-9, self._high_time_threshold - self._low_time_threshold)
+        self._cap_range = self._low_time_reward - self._high_time_cap
+
+    low_time_reward = _cached_input("low_time_reward", _recompute_cached)
+    high_time_threshold = _cached_input("high_time_threshold", _recompute_cached)
+    low_time_threshold = _cached_input("low_time_threshold", _recompute_cached)
+    high_time_cap = _cached_input("high_time_cap", _recompute_cached)
+
+    # -----------------------------
+    # Pooling
+    # -----------------------------
+    @classmethod
+    def acquire(cls, **kwargs) -> "DynamicDifficultyScaler":
+        """
+        Return a DDS reset to a fresh state, reusing a released instance when
+        one is available. Accepts the same keyword arguments as __init__.
+        """
+        pool = cls._pool()
+        inst = pool.pop() if pool else cls.__new__(cls)
+        inst._reset(**kwargs)
+        inst._pooled = False
+        return inst
+
+    def release(self) -> None:
+        # Hand this instance back to the pool; don't use it afterwards.
+        # Releasing an already released instance is a no-op.
+        if self._pooled:
+            return
+        self._pooled = True
+        type(self)._pool().append(self)
+
+    @classmethod
+    def _pool(cls) -> "deque[DynamicDifficultyScaler]":
+        # Look in cls.__dict__ so a subclass never shares (or inherits) the
+        # base class free-list and acquire() always returns a cls instance.
+        pool = cls.__dict__.get("_POOL")
+        if pool is None:
+            pool = cls._POOL = deque()
+        return pool
 
     # -----------------------------
     # Engine integration setters
@@ -61,10 +352,12 @@ class DynamicDifficultyScaler:
         self.earned_points = points
     
     def set_visible_time_remaining(self, visible_time_remaining: float) -> None:
-        self.visible_time_remaining = max(0.0, float(visible_time_remaining))
+        x = visible_time_remaining if type(visible_time_remaining) is float else float(visible_time_remaining)
+        self.visible_time_remaining = x if x > 0.0 else 0.0
 
     def set_visible_total_time(self, visible_total_time: float) -> None:
-        self.visible_total_time = max(0.0, float(visible_total_time))
+        x = visible_total_time if type(visible_total_time) is float else float(visible_total_time)
+        self.visible_total_time = x if x > 0.0 else 0.0
 
     # Must recieve time in minutes, not seconds
     def set_visible_time(self, remaining: float, total: float) -> None:
@@ -76,9 +369,13 @@ class DynamicDifficultyScaler:
 
     def add_visible_time(self, delta_minutes: float, record_to_ledger: bool = True) -> None:
         #Optional helper for if DDS needs to directly modify the engine timer.
-        dm = float(delta_minutes)
-        self.visible_time_remaining = max(0.0, self.visible_time_remaining + dm)
-        self.visible_total_time = max(self.visible_total_time, self.visible_time_remaining)
+        dm = delta_minutes if type(delta_minutes) is float else float(delta_minutes)
+        vtr = self.visible_time_remaining + dm
+        if not vtr > 0.0:
+            vtr = 0.0
+        self.visible_time_remaining = vtr
+        if vtr > self.visible_total_time:
+            self.visible_total_time = vtr
         if record_to_ledger:
             self.awarded_time_ledger += dm
 
@@ -102,33 +399,40 @@ class DynamicDifficultyScaler:
           - Between thresholds -> interpolate cap.
           - Baseline curve uses (1 - t)^2 where t = remaining / effective_total.
         """
+        return self._time_reward_from(self._effective_total())
+
+    def _time_reward_from(self, eff_total: float) -> float:
+        # calculate_time_reward for an already computed _effective_total().
         vtr = max(0.0, self.visible_time_remaining)
-        eff_total = max(1e-9, self._effective_total())
-        t = max(0.0, min(vtr / eff_total, 1.0))
-
-        base = float(self.normal_time_reward)
-        max_late = float(self.low_time_reward)
-
-        # Force max reward if very little time remains
-        if vtr < 20.0:
-            return max_late
-
-        # Dynamic cap from absolute minutes remaining
-        if vtr >= self.high_time_threshold:
-            cap = float(self.high_time_cap)
-        elif vtr <= self.low_time_threshold:
-            cap = max_late
-        else:
-            span = max(1e-9, self.high_time_threshold - self.low_time_threshold)
-            frac = (self.high_time_threshold - vtr) / span  # 0 at high_thr, 1 at low_thr
-            cap = self.high_time_cap + (max_late - self.high_time_cap) * frac
-        # Baseline nonlinear curve
-        reward = base + (max_late - base) * (1 - t) ** 2
-        # Clamp to cap (keep min at base)
-        reward = max(base, min(reward, cap))
-        # if reward < 10:
-        #     return 10
-        return float(reward)
+        return float(_time_reward_kernel(vtr, eff_total,
+                                         float(self.normal_time_reward),
+                                         float(self._low_time_reward),
+                                         float(self._high_time_threshold),
+                                         float(self._high_time_cap),
+                                         self._cap_range,
+                                         self._inv_span))
+
+    def calculate_time_rewards(self, vtr: "np.ndarray") -> "np.ndarray":
+        """
+        Vectorized calculate_time_reward over an array of visible_time_remaining
+        values (minutes), e.g. for plotting or balancing the reward curve.
+        Each element matches what calculate_time_reward would return had the
+        engine reported that remaining time. Requires numpy.
+        """
+        if np is None:
+            raise ImportError("calculate_time_rewards requires numpy")
+        vtr = np.maximum(np.asarray(vtr, dtype=np.float64), 0.0)
+        # Same as _effective_total with each vtr substituted in
+        eff_total = np.maximum(max(self.start_visible_total_time + self.awarded_time_ledger,
+                                   self.visible_total_time), vtr)
+
+        return _time_rewards_np(vtr, eff_total,
+                                float(self.normal_time_reward),
+                                float(self._low_time_reward),
+                                float(self._high_time_threshold),
+                                float(self._high_time_cap),
+                                self._cap_range,
+                                self._inv_span)
 
     # -----------------------------
     # Milestone/flag logic
@@ -153,37 +457,84 @@ class DynamicDifficultyScaler:
         """
         vtr = float(self.visible_time_remaining)
         eff_total = self._effective_total()
-        visible_elapsed = max(0.0, eff_total - vtr)
-
-        # If effectively no progress in visible time, don't change value
-        # if visible_elapsed < 1e-6:
-        #     return int(self.milestone_value)
-
-        # Expected points by now to finish around target_win_time
-        elapsed_for_target = min(visible_elapsed, self.target_win_time)
-        expected_points = (elapsed_for_target / self.target_win_time) * self.target_points
-        pace_ratio = (self.earned_points / expected_points) if expected_points > 0 else 1.0
-
-        # Absolute time factor: t near 1 early-game, 0 late-game
-        t = max(0.0, min(vtr / eff_total, 1.0))
-        # Make reductions stronger early: factor in [1, 2]
-        reduction_strength = self.adjustment_rate * (1.0 + t ** 2)
-        # Make increases milder early, stronger late
-        increase_strength = self.adjustment_rate / (1.0 + t ** 2)
-
-        if pace_ratio > 1.0:
-            # Exponential reduction when ahead of pace (more aggressive early)
-            self.milestone_value *= (1.0 / pace_ratio) ** reduction_strength
-        elif pace_ratio < 1.0:
-            # Linear(ish) boost when behind pace (gentler early)
-            self.milestone_value *= 1.0 + increase_strength * (1.0 - pace_ratio)
-
-        # Clamp
-        self.milestone_value = max(self.min_milestone_value,
-                                   min(self.milestone_value, self.max_milestone_value))
-        self.milestone_value = int(round(self.milestone_value))
+        new_value = _update_mv_kernel(float(self.milestone_value), float(self.earned_points),
+                                      vtr, eff_total,
+                                      float(self.target_win_time), float(self.target_points),
+                                      float(self.adjustment_rate),
+                                      float(self.min_milestone_value),
+                                      float(self.max_milestone_value))
+        self.milestone_value = int(round(new_value))
         return int(self.milestone_value)
 
+    # -----------------------------
+    # Batch simulation
+    # -----------------------------
+    @classmethod
+    def simulate_batch(cls, cfgs: "np.ndarray", events: "np.ndarray") -> "np.ndarray":
+        """
+        Simulate many matches at once for balance sweeps, holding each field in
+        _PERSIST_FIELDS as one contiguous float32 column across all matches
+        (plenty of precision for tuning; single-instance play stays float64).
+        Requires numpy.
+          - cfgs: (N, len(_PERSIST_FIELDS)) starting states, one row per match,
+            columns in _PERSIST_FIELDS order (the values save_state writes).
+          - events: (S, N) minutes of visible time that pass before match n
+            completes its next milestone at step s; NaN = no milestone that step.
+        Each milestone is applied like the usual engine loop on a single DDS:
+        set_visible_time_remaining, complete_milestone, add_visible_time(bonus),
+        then update_milestone_value. Returns the final states laid out like cfgs.
+        """
+        if np is None:
+            raise ImportError("simulate_batch requires numpy")
+        cfgs = np.asarray(cfgs, dtype=np.float32)
+        events = np.asarray(events, dtype=np.float32)
+        if cfgs.ndim != 2 or cfgs.shape[1] != len(_PERSIST_FIELDS):
+            raise ValueError(f"cfgs must have shape (N, {len(_PERSIST_FIELDS)})")
+        if events.ndim != 2 or events.shape[1] != cfgs.shape[0]:
+            raise ValueError(f"events must have shape (S, {cfgs.shape[0]})")
+
+        # SoA: one contiguous row per field; the columns below are views into it.
+        # Always a fresh copy so the caller's cfgs is never written to.
+        soa = np.array(cfgs.T, dtype=np.float32, order="C", copy=True)
+        col = dict(zip(_PERSIST_FIELDS, soa))
+        mv = col["milestone_value"]
+        earned = col["earned_points"]
+        vtt = col["visible_total_time"]
+        vtr = col["visible_time_remaining"]
+        ledger = col["awarded_time_ledger"]
+        start = col["start_visible_total_time"]
+        normal = col["normal_time_reward"]
+        low = col["low_time_reward"]
+        high_thr = col["high_time_threshold"]
+        high_cap = col["high_time_cap"]
+        # Same derived constants as _recompute_cached
+        inv_span = np.float32(1.0) / np.maximum(np.float32(1e-9), high_thr - col["low_time_threshold"])
+        cap_range = low - high_cap
+
+        zero = np.float32(0.0)
+        for dt in events:
+            hit = ~np.isnan(dt)
+            if not hit.any():
+                continue
+            # Clock runs down, then the milestone is completed
+            np.copyto(vtr, np.maximum(zero, vtr - dt), where=hit)
+            np.copyto(earned, earned + mv, where=hit)
+            eff_total = np.maximum(np.maximum(start + ledger, vtt), vtr)
+            bonus = _time_rewards_np(vtr, eff_total, normal, low, high_thr,
+                                     high_cap, cap_range, inv_span)
+            # Engine adds the bonus to the clock (idle matches stay untouched)
+            np.maximum(zero, vtr + bonus, out=vtr, where=hit)
+            np.maximum(vtt, vtr, out=vtt, where=hit)
+            np.add(ledger, bonus, out=ledger, where=hit)
+            eff_total = np.maximum(np.maximum(start + ledger, vtt), vtr)
+            new_mv = _update_mvs_np(mv, earned, vtr, eff_total,
+                                    col["target_win_time"], col["target_points"],
+                                    col["adjustment_rate"],
+                                    col["min_milestone_value"], col["max_milestone_value"])
+            np.copyto(mv, np.round(new_mv), where=hit)
+
+        return soa.T.copy()
+
     # -----------------------------
     # State I/O
     # -----------------------------
@@ -192,79 +543,52 @@ class DynamicDifficultyScaler:
     def get_progress(self):
         return self.earned_points
     
-    # Returns the current game state.
-    def get_game_state(self) -> Dict[str, Any]:
-        eff_total = self._effective_total()
+    # Returns the current game state as raw floats; pass round_output=True
+    # for values rounded for display. Use .as_dict() for the labelled dict.
+    def get_game_state(self, round_output: bool = False) -> GameState:
+        earned = self.earned_points
+        target_points = self.target_points
+        twt = self.target_win_time
         vtr = self.visible_time_remaining
+        vtt = self.visible_total_time
+        eff_total = self._effective_total()
         visible_elapsed = max(0.0, eff_total - vtr)
-        reward = self.calculate_time_reward()
+        reward = self._time_reward_from(eff_total)
 
         # For debugging/telemetry
-        elapsed_for_target = min(visible_elapsed, self.target_win_time)
-        expected_points = (elapsed_for_target / self.target_win_time) * self.target_points
-        pace_ratio = (self.earned_points / expected_points) if expected_points > 0 else 1.0
-        return {
-            "Pts Won": round(self.earned_points, 2), # Points won so far
-            "Pts Rem": max(0.0, round(self.target_points - self.earned_points, 2)), # Points remaining
-            "Reward": round(reward, 2), # Current time reward
-            "Flag Val": int(self.milestone_value),
-            "Clock": round(self.visible_time_remaining, 2),
-            "TT": round(self.visible_total_time, 2), # Visible total time
-            "ET": round(eff_total, 2), # Effective total time
-            "Time Elapsed": round(visible_elapsed, 2), # Visibile time elapsed
-            "TWT": round(self.target_win_time, 2), # Target win time
-            "PR": round(pace_ratio, 3), # Pace ratio
-        }
+        elapsed_for_target = min(visible_elapsed, twt)
+        expected_points = (elapsed_for_target / twt) * target_points
+        pace_ratio = (earned / expected_points) if expected_points > 0 else 1.0
+        pts_rem = max(0.0, target_points - earned)
+        if round_output:
+            return GameState(round(earned, 2), round(pts_rem, 2), round(reward, 2),
+                             int(self.milestone_value), round(vtr, 2), round(vtt, 2),
+                             round(eff_total, 2), round(visible_elapsed, 2),
+                             round(twt, 2), round(pace_ratio, 3))
+        return GameState(earned, pts_rem, reward, int(self.milestone_value), vtr, vtt,
+                         eff_total, visible_elapsed, twt, pace_ratio)
 
     # Saves the current state of the game to a JSON.
     def save_state(self, filepath: str = "game_state.json") -> None:
-        state = {
-            "target_points": self.target_points,
-            "initial_milestone_value": self.initial_milestone_value,
-            "milestone_value": self.milestone_value,
-            "earned_points": self.earned_points,
-            "visible_total_time": self.visible_total_time,
-            "visible_time_remaining": self.visible_time_remaining,
-            "target_win_time": self.target_win_time,
-            "normal_time_reward": self.normal_time_reward,
-            "low_time_reward": self.low_time_reward,
-            "high_time_threshold": self.high_time_threshold,
-            "low_time_threshold": self.low_time_threshold,
-            "high_time_cap": self.high_time_cap,
-            "start_visible_total_time": self.start_visible_total_time,
-            "awarded_time_ledger": self.awarded_time_ledger,
-            "adjustment_rate": self.adjustment_rate,
-            "min_milestone_value": self.min_milestone_value,
-            "max_milestone_value": self.max_milestone_value,
-        }
-        with open(filepath, "w") as f:
-            json.dump(state, f, indent=2)
+        # float() so engine-supplied numeric types (e.g. numpy scalars) serialize
+        state = {k: float(getattr(self, k)) for k in _PERSIST_FIELDS}
+        with open(filepath, "wb") as f:
+            f.write(_dumps(state))
 
     # Loads the current state of the game to a JSON.
     def load_state(self, filepath: str = "game_state.json") -> bool:
         if not os.path.exists(filepath):
             print(f"[INFO] Save file '{filepath}' not found. Using default state.")
             return False
-        with open(filepath, "r") as f:
-            state = json.load(f)
-
-        # Restore with safe defaults for older saves
-        self.target_points = float(state.get("target_points", self.target_points))
-        self.initial_milestone_value = float(state.get("initial_milestone_value", self.initial_milestone_value))
-        self.milestone_value = float(state.get("milestone_value", self.milestone_value))
-        self.earned_points = float(state.get("earned_points", self.earned_points))
-        self.visible_total_time = float(state.get("visible_total_time", self.visible_total_time))
-        self.visible_time_remaining = float(state.get("visible_time_remaining", self.visible_time_remaining))
-        self.target_win_time = float(state.get("target_win_time", self.target_win_time))
-        self.normal_time_reward = float(state.get("normal_time_reward", self.normal_time_reward))
-        self.low_time_reward = float(state.get("low_time_reward", self.low_time_reward))
-        self.high_time_threshold = float(state.get("high_time_threshold", self.high_time_threshold))
-        self.low_time_threshold = float(state.get("low_time_threshold", self.low_time_threshold))
-        self.high_time_cap = float(state.get("high_time_cap", self.high_time_cap))
-        self.start_visible_total_time = float(state.get("start_visible_total_time", self.start_visible_total_time))
-        self.awarded_time_ledger = float(state.get("awarded_time_ledger", self.awarded_time_ledger))
-        self.adjustment_rate = float(state.get("adjustment_rate", self.adjustment_rate))
-        self.min_milestone_value = float(state.get("min_milestone_value", self.min_milestone_value))
-        self.max_milestone_value = float(state.get("max_milestone_value", self.max_milestone_value))
+        with open(filepath, "rb") as f:
+            state = _loads(f.read())
+
+        # Restore with safe defaults for older saves (missing or null keys)
+        for name, cast in _PERSIST_SPEC:
+            value = state.get(name)
+            if value is None:
+                value = getattr(self, name)
+            setattr(self, name, cast(value))
+        self._recompute_cached()
 
         return True
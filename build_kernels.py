@@ -0,0 +1,32 @@
+"""
+Ahead-of-time compile the DDS scalar kernels into a native ``dds_kernels``
+extension module next to DynamicDifficultyScaler.py, so the game never pays
+numba's JIT warmup at level start. numba is only needed to build:
+
+    python build_kernels.py
+
+DynamicDifficultyScaler picks up dds_kernels when it is importable and
+otherwise falls back to numba JIT (or plain Python without numba).
+"""
+import os
+
+from numba.pycc import CC
+
+from DynamicDifficultyScaler import _KERNEL_VERSION, _time_reward, _update_mv
+
+cc = CC("dds_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Compile from the undecorated Python sources of the JIT kernels
+cc.export("time_reward", "f8(f8, f8, f8, f8, f8, f8, f8, f8)")(_time_reward.py_func)
+cc.export("update_mv", "f8(f8, f8, f8, f8, f8, f8, f8, f8, f8)")(_update_mv.py_func)
+
+
+# Lets DynamicDifficultyScaler reject a build made from older kernel sources
+@cc.export("kernel_version", "i8()")
+def kernel_version():
+    return _KERNEL_VERSION
+
+
+if __name__ == "__main__":
+    cc.compile()
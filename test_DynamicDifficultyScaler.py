@@ -0,0 +1,59 @@
+import pytest
+
+from DynamicDifficultyScaler import DynamicDifficultyScaler, _PERSIST_FIELDS
+
+np = pytest.importorskip("numpy")
+
+
+def _row(dds):
+    return [getattr(dds, k) for k in _PERSIST_FIELDS]
+
+
+def test_simulate_batch_leaves_cfgs_unchanged():
+    events = np.full((3, 1), 5.0, dtype=np.float32)
+    # (1, F) float32 input and an SoA (F, N) array passed transposed: both
+    # used to come back from np.ascontiguousarray as views of the input.
+    single = np.array([_row(DynamicDifficultyScaler())], dtype=np.float32)
+    soa = np.ascontiguousarray(np.array([_row(DynamicDifficultyScaler())] * 4,
+                                        dtype=np.float32).T)
+    for cfgs, ev in ((single, events), (soa.T, np.full((3, 4), 5.0, dtype=np.float32))):
+        before = cfgs.copy()
+        DynamicDifficultyScaler.simulate_batch(cfgs, ev)
+        assert np.array_equal(cfgs, before)
+
+
+def test_simulate_batch_matches_scalar_loop_with_idle_steps():
+    rng = np.random.default_rng(7)
+    n, steps = 300, 40
+    matches = []
+    for _ in range(n):
+        dds = DynamicDifficultyScaler(target_points=float(rng.choice([50, 100, 250])),
+                                      initial_milestone_value=rng.uniform(2, 15),
+                                      visible_total_time=rng.uniform(40, 200),
+                                      target_win_time=rng.uniform(100, 500),
+                                      adjustment_rate=rng.uniform(0.1, 0.5))
+        # Start some matches with more time on the clock than the visible total
+        if rng.random() < 0.5:
+            dds.set_visible_time_remaining(dds.visible_total_time + rng.uniform(1, 60))
+        matches.append(dds)
+    # float32 round-trip so both paths start from identical inputs
+    cfgs = np.array([_row(d) for d in matches], dtype=np.float32)
+    for dds, row in zip(matches, cfgs):
+        for k, v in zip(_PERSIST_FIELDS, row):
+            setattr(dds, k, float(v))
+    events = rng.uniform(0, 15, size=(steps, n)).astype(np.float32)
+    events[rng.random((steps, n)) < 0.4] = np.nan
+
+    out = DynamicDifficultyScaler.simulate_batch(cfgs, events)
+
+    for step in events:
+        for dds, dt in zip(matches, step):
+            if np.isnan(dt):
+                continue
+            dds.set_visible_time_remaining(dds.visible_time_remaining - float(dt))
+            dds.add_visible_time(dds.complete_milestone())
+            dds.update_milestone_value()
+    expected = np.array([_row(d) for d in matches])
+    mv = _PERSIST_FIELDS.index("milestone_value")
+    assert np.array_equal(out[:, mv], expected[:, mv])
+    assert np.allclose(out, expected, rtol=1e-4)